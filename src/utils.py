@@ -5,23 +5,23 @@ Funções utilitárias usadas no projeto de Credit Scoring.
 Inclui:
 - Métricas de performance (KS, AUC, Gini).
 - Construção de tabelas por quantil de score.
-- KS "seguro" para uso em groupby (ex.: por safra).
-- Cálculo de PSI (Population Stability Index) por feature e por dataframe.
+- KS "seguro" para uso em groupby e KS vetorizado por grupo (ex.: por safra).
+- Cálculo de PSI (Population Stability Index) por feature e por dataframe,
+  com separação entre ajuste dos bins (psi_fit) e cálculo (psi_score).
 """
 
 from __future__ import annotations
 
+import warnings
 from typing import List, Tuple
 
 import numpy as np
 import pandas as pd
+from joblib import Parallel, delayed
+from sklearn.exceptions import UndefinedMetricWarning
 from sklearn.metrics import (
-    roc_auc_score,
-    accuracy_score,
-    precision_score,
-    recall_score,
-    f1_score,
-    confusion_matrix,
+    auc as area_under_curve,
+    roc_curve,
 )
 
 
@@ -30,11 +30,30 @@ from sklearn.metrics import (
 # =========================
 
 
+def _as_float_array(values) -> np.ndarray:
+    """
+    Converte uma Series/array para ndarray float, com missing como NaN.
+
+    Dados já em float32 são mantidos em float32 (sem cópia para float64).
+    """
+    if isinstance(values, (pd.Series, pd.Index)):
+        dtype = np.float32 if values.dtype == np.float32 else np.float64
+        return values.to_numpy(dtype=dtype, na_value=np.nan)
+
+    values = np.asarray(values)
+    if values.dtype in (np.float32, np.float64):
+        return values
+    return values.astype(np.float64)
+
+
 def ks_score(y_true, y_proba) -> float:
     """
     Calcula o KS (Kolmogorov-Smirnov) entre bons (0) e maus (1)
     a partir das probabilidades previstas.
 
+    Scores empatados são tratados como um único ponto de corte, de modo
+    que o resultado coincide com o KS de `performance_metrics`.
+
     Parâmetros
     ----------
     y_true : array-like
@@ -47,22 +66,65 @@ def ks_score(y_true, y_proba) -> float:
     float
         Valor do KS (entre 0 e 1).
     """
-    data = (
-        pd.DataFrame({"y": y_true, "score": y_proba})
-        .sort_values("score", ascending=False)
-    )
+    y = np.asarray(y_true, dtype=np.int8)
+    p = _as_float_array(y_proba)
 
-    total_bad = (data["y"] == 1).sum()
-    total_good = (data["y"] == 0).sum()
-
-    if total_bad == 0 or total_good == 0:
+    total_bad = int(y.sum())
+    if total_bad == 0 or total_bad == y.size:
         return 0.0
 
-    data["cum_bad"] = (data["y"] == 1).cumsum() / total_bad
-    data["cum_good"] = (data["y"] == 0).cumsum() / total_good
+    return _ks_core(y, p, total_bad)
+
+
+def _ks_core(y: np.ndarray, p: np.ndarray, total_bad: int) -> float:
+    """
+    Núcleo do KS para arrays já convertidos (labels int8, scores float)
+    com pelo menos um bom e um mau. Não faz conversão nem validação.
+    """
+    # ordena pelo score de forma decrescente
+    order = np.argsort(-p)
+    y_sorted = y[order]
+    p_sorted = p[order]
+
+    # cum_bad - cum_good = cumsum(y / total_bad - (1 - y) / total_good),
+    # então basta um único cumsum sobre os pesos de cada observação
+    inv_bad = 1.0 / total_bad
+    inv_good = 1.0 / (y_sorted.size - total_bad)
+    weights = y_sorted * (inv_bad + inv_good) - inv_good
+
+    np.cumsum(weights, out=weights)
+
+    # scores empatados formam um único ponto de corte: o KS só é avaliado
+    # na última posição de cada sequência de scores iguais (como na curva
+    # ROC), de modo que a ordem entre empates não altera o resultado
+    run_end = np.append(p_sorted[1:] != p_sorted[:-1], True)
 
-    ks = (data["cum_bad"] - data["cum_good"]).abs().max()
-    return float(ks)
+    return float(np.abs(weights[run_end]).max())
+
+
+def _ks_auc(y_true, y_proba) -> Tuple[float, float]:
+    """
+    Calcula KS e AUC a partir de uma única curva ROC.
+
+    O KS é o máximo de |TPR - FPR|, de modo que a ordenação dos scores
+    é feita uma única vez para as duas métricas.
+    """
+    # com uma única classe, segue o sklearn: AUC indefinida (NaN, com
+    # aviso) e KS 0, como em ks_score
+    n_bad = np.count_nonzero(y_true)
+    if n_bad == 0 or n_bad == len(y_true):
+        warnings.warn(
+            "Only one class is present in y_true. "
+            "ROC AUC score is not defined in that case.",
+            UndefinedMetricWarning,
+        )
+        return 0.0, float("nan")
+
+    fpr, tpr, _ = roc_curve(y_true, y_proba)
+
+    ks = np.max(np.abs(tpr - fpr))
+    auc = area_under_curve(fpr, tpr)
+    return float(ks), float(auc)
 
 
 def performance_metrics(y_true, y_proba):
@@ -81,11 +143,10 @@ def performance_metrics(y_true, y_proba):
     tuple
         (ks, auc, gini)
     """
-    y_true = np.array(y_true)
-    y_proba = np.array(y_proba)
+    y_true = np.asarray(y_true, dtype=np.int8)
+    y_proba = _as_float_array(y_proba)
 
-    auc = roc_auc_score(y_true, y_proba)
-    ks = ks_score(y_true, y_proba)
+    ks, auc = _ks_auc(y_true, y_proba)
     gini = 2 * auc - 1
 
     return float(ks), float(auc), float(gini)
@@ -113,22 +174,28 @@ def full_performance_metrics(y_true, y_proba, threshold: float = 0.5) -> dict:
         - Accuracy, Precision, Recall, F1
         - TP, TN, FP, FN
     """
-    y_true = np.array(y_true)
-    y_proba = np.array(y_proba)
-    y_pred = (y_proba >= threshold).astype(int)
+    y_true = np.asarray(y_true, dtype=np.int8)
+    y_proba = _as_float_array(y_proba)
+    y_pred = y_proba >= threshold
 
     # métricas de rankeamento
-    auc = roc_auc_score(y_true, y_proba)
-    ks = ks_score(y_true, y_proba)
+    ks, auc = _ks_auc(y_true, y_proba)
     gini = 2 * auc - 1
 
     # métricas de classificação binária
-    acc = accuracy_score(y_true, y_pred)
-    prec = precision_score(y_true, y_pred, zero_division=0)
-    rec = recall_score(y_true, y_pred, zero_division=0)
-    f1 = f1_score(y_true, y_pred, zero_division=0)
-
-    tn, fp, fn, tp = confusion_matrix(y_true, y_pred).ravel()
+    # matriz de confusão por contagem direta sobre arrays booleanos
+    # (1 byte por elemento); FP, FN e TN saem dos totais marginais
+    y_bad = y_true == 1
+    tp = int(np.count_nonzero(y_pred & y_bad))
+    fp = int(np.count_nonzero(y_pred)) - tp
+    fn = int(np.count_nonzero(y_bad)) - tp
+    tn = y_true.size - tp - fp - fn
+
+    # divisões por zero resultam em 0, como zero_division=0 do sklearn
+    acc = (tp + tn) / (tp + tn + fp + fn)
+    prec = tp / (tp + fp) if tp + fp else 0.0
+    rec = tp / (tp + fn) if tp + fn else 0.0
+    f1 = 2 * tp / (2 * tp + fp + fn) if tp + fp + fn else 0.0
 
     return {
         "AUC": float(auc),
@@ -178,31 +245,43 @@ def construct_metrics_table(
     Retorno
     -------
     DataFrame
-        Colunas:
-        - quantil_col
+        Uma linha por rótulo de `ordered_labels` presente em `quantil_col`
+        (categorias, se Categorical, ou valores observados), nessa ordem;
+        categorias sem observações ficam com volume 0. Rótulos de
+        `quantil_col` fora de `ordered_labels` não entram na tabela. Colunas:
+        - quantil_col (Categorical ordenado por `ordered_labels`)
         - volume
         - event_rate
         - score_min
         - score_max
     """
+    # uma única agregação sobre as duas colunas
     tabela = (
-        df.groupby(quantil_col)
-        .agg(
-            volume=(target_col, "size"),
-            event_rate=(target_col, "mean"),
-            score_min=(score_col, "min"),
-            score_max=(score_col, "max"),
-        )
-        .reset_index()
+        df.groupby(quantil_col, observed=True, sort=False)
+        .agg({target_col: ["size", "mean"], score_col: ["min", "max"]})
     )
-
-    # garantir ordem dos rótulos
+    tabela.columns = ["volume", "event_rate", "score_min", "score_max"]
+
+    # rótulos possíveis: categorias da coluna (se Categorical) ou grupos
+    # observados; quantis colapsados, fora das categorias, não entram
+    col = df[quantil_col]
+    if isinstance(col.dtype, pd.CategoricalDtype):
+        present = set(col.cat.categories)
+    else:
+        present = set(tabela.index)
+
+    # garantir ordem dos rótulos (categorias sem observações ficam com volume 0)
+    tabela.index = tabela.index.astype(object)
+    tabela = tabela.reindex([lab for lab in ordered_labels if lab in present])
+    tabela.index.name = quantil_col
+    tabela["volume"] = tabela["volume"].fillna(0).astype(int)
+
+    tabela = tabela.reset_index()
     tabela[quantil_col] = pd.Categorical(
         tabela[quantil_col],
         categories=ordered_labels,
         ordered=True,
     )
-    tabela = tabela.sort_values(quantil_col)
 
     return tabela
 
@@ -229,10 +308,107 @@ def ks_safe(y_true, y_proba) -> float:
     float
         KS calculado ou NaN se não há pelo menos um bom e um mau.
     """
-    y_arr = np.array(y_true)
-    if (y_arr == 1).sum() == 0 or (y_arr == 0).sum() == 0:
+    y_arr = np.asarray(y_true, dtype=np.int8)
+    n_bad = int(y_arr.sum())
+    if n_bad == 0 or n_bad == y_arr.size:
         return np.nan
-    return ks_score(y_true, y_proba)
+    return _ks_core(y_arr, _as_float_array(y_proba), n_bad)
+
+
+def ks_by_group(y_true, y_proba, group) -> pd.Series:
+    """
+    Calcula o KS de cada grupo (ex.: safra) de uma só vez, sem chamar
+    `ks_safe` grupo a grupo via groupby.apply.
+
+    As linhas são ordenadas por (grupo, score) e o KS de cada grupo sai
+    de um único cumsum segmentado.
+
+    Parâmetros
+    ----------
+    y_true : array-like
+        Labels verdadeiros (0/1).
+    y_proba : array-like
+        Probabilidades previstas de ser 1.
+    group : array-like
+        Identificador do grupo de cada linha (ex.: coluna 'safra').
+
+    Retorno
+    -------
+    Series
+        KS por grupo (índice ordenado), NaN nos grupos sem pelo menos
+        um bom e um mau. Equivale a
+        `df.groupby(group).apply(lambda g: ks_safe(g[y], g[score]))`.
+    """
+    # pd.array preserva np.nan/None como missing (np.asarray faria
+    # de np.nan a string 'nan' em listas de texto)
+    if not isinstance(group, (pd.Series, pd.Index)):
+        group = pd.array(group)
+    codes, groups = pd.factorize(group, sort=True)
+    index = pd.Index(groups, name=getattr(group, "name", None))
+
+    y = np.asarray(y_true, dtype=np.int8)
+    p = _as_float_array(y_proba)
+
+    # grupos nulos ficam de fora, como no groupby
+    valid = codes >= 0
+    if not valid.all():
+        codes, y, p = codes[valid], y[valid], p[valid]
+
+    n_groups = len(groups)
+    ks = np.full(n_groups, np.nan)
+    if y.size == 0:
+        return pd.Series(ks, index=index)
+
+    total = np.bincount(codes, minlength=n_groups)
+    total_bad = np.bincount(codes, weights=y, minlength=n_groups)
+    total_good = total - total_bad
+    has_both = (total_bad > 0) & (total_good > 0)
+
+    with np.errstate(divide="ignore"):
+        inv_bad = np.where(has_both, 1.0 / total_bad, 0.0)
+        inv_good = np.where(has_both, 1.0 / total_good, 0.0)
+
+    # agrupa as linhas com uma ordenação estável dos códigos (radix sort
+    # em um dtype inteiro pequeno) e ordena o score dentro de cada grupo;
+    # ordenar segmentos contíguos pequenos é bem mais barato que um
+    # argsort global. Grupos sem bons e maus ficam NaN e não são ordenados.
+    small_codes = codes.astype(np.min_scalar_type(n_groups))
+    by_group = np.argsort(small_codes, kind="stable")
+    y_sorted = y[by_group]
+    neg_p_sorted = -p[by_group]
+
+    bounds = np.r_[0, np.cumsum(total)]
+    for k in np.flatnonzero(has_both):
+        lo, hi = bounds[k], bounds[k + 1]
+        idx = np.argsort(neg_p_sorted[lo:hi])
+        y_sorted[lo:hi] = y_sorted[lo:hi][idx]
+        neg_p_sorted[lo:hi] = neg_p_sorted[lo:hi][idx]
+
+    # pesos y / total_bad - (1 - y) / total_good de cada grupo
+    weights = (
+        y_sorted * np.repeat(inv_bad + inv_good, total)
+        - np.repeat(inv_good, total)
+    )
+    cum = np.cumsum(weights)
+
+    # zera o acumulado no início de cada grupo
+    nonempty = total > 0
+    starts = bounds[:-1][nonempty]
+    ends = bounds[1:][nonempty]
+    offsets = np.r_[0.0, cum[starts[1:] - 1]]
+    cum -= np.repeat(offsets, total[nonempty])
+
+    # só a última posição de cada sequência de scores empatados conta,
+    # como no ks_score; a última linha de cada grupo sempre entra
+    run_end = np.append(neg_p_sorted[1:] != neg_p_sorted[:-1], True)
+    run_end[ends - 1] = True
+
+    np.abs(cum, out=cum)
+    cum[~run_end] = 0.0
+    ks[nonempty] = np.maximum.reduceat(cum, starts)
+    ks[~has_both] = np.nan
+
+    return pd.Series(ks, index=index)
 
 
 # =========================
@@ -240,52 +416,179 @@ def ks_safe(y_true, y_proba) -> float:
 # =========================
 
 
-def psi_for_feature(
-    train: pd.Series, test: pd.Series, n_bins: int = 10
-) -> float:
+def _bin_counts(values: np.ndarray, bin_edges: np.ndarray) -> np.ndarray:
     """
-    Calcula o PSI de uma feature, tratando missing como um bin separado
-    e usando quantis do treino para definir os bins.
+    Conta quantos valores caem em cada bin definido por `bin_edges`.
+
+    Os bins são fechados à direita, (a, b], com o primeiro incluindo o
+    limite inferior (mesma convenção de pd.cut com include_lowest=True).
+    Valores fora do intervalo dos bins são descartados.
     """
-    train = pd.Series(train)
-    test  = pd.Series(test)
+    n_edges = len(bin_edges)
 
-    # máscaras de missing
-    mask_exp_nan = train.isna()
-    mask_act_nan = test.isna()
+    # índice 0 = abaixo do primeiro bin, n_edges = acima do último
+    idx = np.searchsorted(bin_edges, values, side="left")
+    idx[values == bin_edges[0]] = 1
 
-    # só não nulos para definir os bins
-    train_non_null = train[~mask_exp_nan]
-    test_non_null  = test[~mask_act_nan]
+    counts = np.bincount(idx, minlength=n_edges + 1)
+    return counts[1:n_edges]
 
-    if train_non_null.empty:
-        return 0.0
+
+def _sorted_bin_counts(sorted_vals: np.ndarray, bin_edges: np.ndarray) -> np.ndarray:
+    """
+    Mesmo resultado de `_bin_counts`, mas para valores já ordenados:
+    cada bin sai da busca binária dos limites nos dados (O(k log N)),
+    sem percorrer todos os valores.
+    """
+    cum = np.searchsorted(sorted_vals, bin_edges, side="right")
+    cum[0] = np.searchsorted(sorted_vals, bin_edges[0], side="left")
+    return np.diff(cum)
+
+
+def _counts_with_missing(values: np.ndarray, bin_edges: np.ndarray) -> np.ndarray:
+    """
+    Contagem por bin com "Missing" (NaN) como última posição.
+    """
+    mask_nan = np.isnan(values)
+    return np.append(_bin_counts(values[~mask_nan], bin_edges), mask_nan.sum())
+
+
+def _quantiles_from_sorted(
+    sorted_vals: np.ndarray, n_valid, quantiles: np.ndarray
+) -> np.ndarray:
+    """
+    Quantis (interpolação linear, como np.quantile) de valores já
+    ordenados ao longo do eixo 0, com NaN no final.
+
+    `n_valid` é o número de valores não nulos (por coluna, se 2D).
+    Com os dados ordenados, cada quantil é só uma indexação, e o
+    resultado é idêntico ao de np.quantile/np.nanquantile.
+    """
+    # sem linhas, não há quantis: bordas NaN (PSI 0 por feature)
+    if sorted_vals.shape[0] == 0:
+        return np.full((len(quantiles),) + sorted_vals.shape[1:], np.nan)
+
+    q = quantiles.reshape((-1,) + (1,) * (sorted_vals.ndim - 1))
+    last = np.maximum(np.asarray(n_valid) - 1, 0)
+
+    virtual = (np.asarray(n_valid) - 1) * q
+    previous = np.floor(virtual)
+    gamma = virtual - previous
+
+    prev_idx = np.clip(previous.astype(np.intp), 0, last)
+    next_idx = np.minimum(prev_idx + 1, last)
+    a = np.take_along_axis(sorted_vals, prev_idx, axis=0)
+    b = np.take_along_axis(sorted_vals, next_idx, axis=0)
+
+    # mesma interpolação de np.quantile (numericamente estável)
+    diff = b - a
+    result = a + diff * gamma
+    np.subtract(b, diff * (1 - gamma), out=result, where=gamma >= 0.5)
+    return result
+
+
+def _expected_dist(
+    train_sorted: np.ndarray, n_missing: int, bin_edges: np.ndarray
+) -> np.ndarray:
+    """
+    Distribuição esperada (treino) por bin, com "Missing" como última
+    posição, a partir dos valores não nulos do treino já ordenados.
+    """
+    if len(bin_edges) < 2:
+        return np.empty(0)
+
+    # histograma do treino direto dos valores ordenados
+    exp_counts = np.append(_sorted_bin_counts(train_sorted, bin_edges), n_missing)
+    return exp_counts / (train_sorted.size + n_missing)
+
+
+def psi_fit(
+    train: pd.Series, n_bins: int = 10
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Define os bins de uma feature a partir dos quantis do treino e
+    calcula a distribuição esperada (treino) em cada bin.
+
+    Útil em monitoramento: os bins são ajustados uma única vez na base
+    de desenvolvimento e reaproveitados em cada nova base com `psi_score`.
+
+    Parâmetros
+    ----------
+    train : Series
+        Valores da feature no treino (base de referência).
+    n_bins : int, default=10
+        Número de bins (quantis).
+
+    Retorno
+    -------
+    (bin_edges, exp_dist)
+        bin_edges : limites dos bins (vazio se não há valores não nulos).
+        exp_dist : proporção do treino em cada bin, com "Missing"
+            como última posição.
+    """
+    train = _as_float_array(train)
+
+    # só não nulos para definir os bins
+    train_sorted = np.sort(train[~np.isnan(train)])
+    if train_sorted.size == 0:
+        return np.empty(0), np.empty(0)
 
     quantiles = np.linspace(0, 1, n_bins + 1)
-    bin_edges = np.unique(np.quantile(train_non_null, quantiles))
+    bin_edges = np.unique(
+        _quantiles_from_sorted(train_sorted, train_sorted.size, quantiles)
+    )
+    exp_dist = _expected_dist(
+        train_sorted, train.size - train_sorted.size, bin_edges
+    )
+    return bin_edges, exp_dist
+
+
+def psi_score(
+    bin_edges: np.ndarray, exp_dist: np.ndarray, test: pd.Series
+) -> float:
+    """
+    Calcula o PSI de uma feature usando bins já ajustados com `psi_fit`.
+
+    Parâmetros
+    ----------
+    bin_edges : ndarray
+        Limites dos bins retornados por `psi_fit`.
+    exp_dist : ndarray
+        Distribuição esperada retornada por `psi_fit`.
+    test : Series
+        Valores da feature na base a ser comparada.
+
+    Retorno
+    -------
+    float
+        Valor do PSI (0 se não há bins válidos).
+    """
     if len(bin_edges) < 2:
         return 0.0
 
-    exp_bins = pd.cut(train_non_null, bins=bin_edges, include_lowest=True)
-    act_bins = pd.cut(test_non_null,  bins=bin_edges, include_lowest=True)
+    act_counts = _counts_with_missing(_as_float_array(test), bin_edges)
 
-    # adiciona "Missing" como categoria
-    exp_all = pd.concat([exp_bins, pd.Series(["Missing"] * mask_exp_nan.sum())])
-    act_all = pd.concat([act_bins, pd.Series(["Missing"] * mask_act_nan.sum())])
+    # só entram os bins observados no treino
+    observed = exp_dist > 0
+    exp_dist = exp_dist[observed]
+    act_dist = act_counts[observed] / max(act_counts.sum(), 1)
 
-    # NÃO ordenar por índice (mistura Interval e str)
-    exp_dist = exp_all.value_counts(normalize=True)
-    act_dist = act_all.value_counts(normalize=True)
+    # clip das duas distribuições em uma chamada e soma via produto interno
+    eps = 1e-6
+    exp_dist, act_dist = np.clip(np.stack((exp_dist, act_dist)), eps, 1)
 
-    # Alinha act_dist ao índice de exp_dist
-    act_dist = act_dist.reindex(exp_dist.index).fillna(0.0)
+    return float(np.dot(exp_dist - act_dist, np.log(exp_dist / act_dist)))
 
-    eps = 1e-6
-    exp_dist = exp_dist.clip(eps, 1)
-    act_dist = act_dist.clip(eps, 1)
 
-    psi_vals = (exp_dist - act_dist) * np.log(exp_dist / act_dist)
-    return float(psi_vals.sum())
+def psi_for_feature(
+    train: pd.Series, test: pd.Series, n_bins: int = 10
+) -> float:
+    """
+    Calcula o PSI de uma feature, tratando missing como um bin separado
+    e usando quantis do treino para definir os bins.
+    """
+    bin_edges, exp_dist = psi_fit(train, n_bins=n_bins)
+    return psi_score(bin_edges, exp_dist, test)
 
 
 def psi_for_dataframe(
@@ -293,6 +596,7 @@ def psi_for_dataframe(
     df_test: pd.DataFrame,
     feature_cols: List[str],
     n_bins: int = 10,
+    n_jobs: int | None = None,
 ) -> pd.Series:
     """
     Calcula o PSI para múltiplas colunas de um DataFrame.
@@ -307,16 +611,46 @@ def psi_for_dataframe(
         Lista de colunas para calcular o PSI.
     n_bins : int, default=10
         Número de bins usados por feature.
+    n_jobs : int, opcional
+        Número de threads usadas para calcular o PSI das features em
+        paralelo (-1 = todos os núcleos). Por padrão, roda sequencialmente.
 
     Retorno
     -------
     Series
         Série com PSI por coluna (ordenada descendentemente).
     """
-    psi_dict = {}
-    for col in feature_cols:
-        psi_dict[col] = psi_for_feature(df_train[col], df_test[col], n_bins=n_bins)
-    return pd.Series(psi_dict).sort_values(ascending=False)
+    # mantém float32 quando todas as features já estão em float32
+    def to_float_array(df: pd.DataFrame) -> np.ndarray:
+        sub = df[feature_cols]
+        dtype = np.float32 if (sub.dtypes == np.float32).all() else np.float64
+        return sub.to_numpy(dtype=dtype, na_value=np.nan)
+
+    train_arr = to_float_array(df_train)
+    test_arr = to_float_array(df_test)
+
+    # quantis de todas as features a partir de uma única ordenação
+    # por coluna (colunas sem nenhum valor no treino resultam em NaN e PSI 0)
+    quantiles = np.linspace(0, 1, n_bins + 1)
+    train_sorted = np.sort(np.asfortranarray(train_arr), axis=0)
+    n_valid = np.count_nonzero(~np.isnan(train_arr), axis=0)
+    edges_all = _quantiles_from_sorted(train_sorted, n_valid, quantiles)
+
+    # cada feature é independente; threads bastam pois o NumPy libera o GIL
+    # e cada uma escreve direto na sua posição do array de saída
+    psi_vals = np.empty(len(feature_cols), dtype=np.float64)
+
+    def fill_psi(j: int) -> None:
+        bin_edges = np.unique(edges_all[:, j])
+        exp_dist = _expected_dist(
+            train_sorted[: n_valid[j], j], len(train_arr) - n_valid[j], bin_edges
+        )
+        psi_vals[j] = psi_score(bin_edges, exp_dist, test_arr[:, j])
+
+    Parallel(n_jobs=n_jobs, require="sharedmem")(
+        delayed(fill_psi)(j) for j in range(len(feature_cols))
+    )
+    return pd.Series(psi_vals, index=feature_cols).sort_values(ascending=False)
 
 # =========================
 # Demais